@@ -1,11 +1,13 @@
 import pandas as pd
 import numpy as np
 import plotly.express as px
-import plotly.graph_objs as go
+import plotly.graph_objects as go
+import plotly.io as pio
 import dash
-from dash import dcc, html
-from dash.dependencies import Input, Output
+from dash import dcc, html, Patch, Input, Output, State, ClientsideFunction
 import dash_bootstrap_components as dbc
+from numba import njit
+from plotly_resampler import FigureResampler
 
 # Load dataset
 FILE_PATH = r'C:\\Users\\nilot\\OneDrive\\Documents\\KU\\IV—I\\COMP 482 (Data Mining)\\Project\\VAR in PL\\VAR_Team_Stats.csv'
@@ -20,52 +22,145 @@ COLORS = {
     'accent': '#e74c3c'
 }
 
+# Shared dashboard colors, registered once as a Plotly template
+pio.templates['var_dash'] = go.layout.Template(
+    layout=dict(
+        plot_bgcolor=COLORS['background'],
+        paper_bgcolor=COLORS['background'],
+        font_color=COLORS['text']
+    )
+)
+
+# error_model='numpy' gives inf/NaN on a zero normalizer instead of raising
+@njit(cache=True, error_model='numpy')
+def _bias_kernel(arr, cols, ngs_max, sdf_max, abs_ngs_max, ov_max):
+    """
+    Fused single-pass bias score over the rows of the numeric block
+    """
+    out = np.empty(arr.shape[0], dtype=np.float64)
+    
+    for i in range(arr.shape[0]):
+        goals_bias = (arr[i, cols[0]] - arr[i, cols[1]]) - (arr[i, cols[2]] - arr[i, cols[3]])
+        subjective_bias = arr[i, cols[4]] - arr[i, cols[5]]
+        
+        out[i] = (
+            0.3 * (goals_bias / ngs_max) +
+            0.2 * (subjective_bias / sdf_max) +
+            0.3 * (arr[i, cols[6]] / abs_ngs_max) +
+            0.2 * (arr[i, cols[7]] / ov_max)
+        )
+    
+    return out
+
 class VARBiasAnalyzer:
+    NUMERIC_COLUMNS = [
+        'Overturns', 'Leading to goals for', 'Disallowed goals for', 
+        'Leading to goals against', 'Disallowed goals against', 
+        'Net goal score', 'Subjective decisions for', 
+        'Subjective decisions against', 'Net subjective score'
+    ]
+    
     def __init__(self, file_path):
         """
         Initialize VAR Bias Analysis
         """
         self.df = pd.read_csv(file_path)
         self._preprocess_data()
+        
+        # Team-indexed view of just the columns the team section reads;
+        # a team listed twice keeps its first row
+        self.team_view = self.df.drop_duplicates('Team').set_index('Team')[
+            ['Overturns', 'Net goal score', 
+             'Subjective decisions for', 'Subjective decisions against', 
+             'Leading to goals for', 'Leading to goals against', 
+             'Disallowed goals for', 'Disallowed goals against']
+        ]
     
     def _preprocess_data(self):
         """
         Preprocess and clean the dataset
         """
-        numeric_columns = [
-            'Overturns', 'Leading to goals for', 'Disallowed goals for', 
-            'Leading to goals against', 'Disallowed goals against', 
-            'Net goal score', 'Subjective decisions for', 
-            'Subjective decisions against', 'Net subjective score'
-        ]
+        # Malformed numeric cells become NaN and are then filled with 0;
+        # low-cardinality team names are stored once as categories
+        self.df = (
+            self.df
+            .assign(**self.df[self.NUMERIC_COLUMNS].apply(pd.to_numeric, errors='coerce'))
+            .fillna({col: 0 for col in self.NUMERIC_COLUMNS})
+            .astype({'Team': 'category'})
+        )
         
-        for col in numeric_columns:
-            self.df[col] = pd.to_numeric(self.df[col], errors='coerce')
+        # Contiguous float32 copy of the numeric block for vectorized math
+        self._num = self.df[self.NUMERIC_COLUMNS].to_numpy(dtype=np.float32, copy=True)
+        self._idx = {col: i for i, col in enumerate(self.NUMERIC_COLUMNS)}
+    
+    def _column(self, name):
+        """
+        Column view into the float32 numeric block
+        """
+        return self._num[:, self._idx[name]]
+    
+    def _bias_normalizers(self):
+        """
+        Table-wide normalizers shared by every bias score row
+        """
+        ngs = self._column('Net goal score')
         
-        self.df.fillna(0, inplace=True)
+        # float64 keeps the divisions at full precision; numpy scalars (unlike
+        # Python floats) still give inf/NaN on a zero normalizer
+        return tuple(np.float64(value) for value in (
+            ngs.max(),
+            self._column('Subjective decisions for').max(),
+            np.abs(ngs).max(),
+            self._column('Overturns').max()
+        ))
     
     def calculate_comprehensive_bias_score(self):
         """
         Calculate a multi-dimensional bias score
         """
-        def bias_score(row):
-            goals_bias = (row['Leading to goals for'] - row['Disallowed goals for']) - \
-                         (row['Leading to goals against'] - row['Disallowed goals against'])
-            
-            subjective_bias = row['Subjective decisions for'] - row['Subjective decisions against']
-            net_goal_impact = row['Net goal score']
-            overturns_impact = row['Overturns']
-            
-            bias_score = (
-                0.3 * (goals_bias / self.df['Net goal score'].max()) +
-                0.2 * (subjective_bias / self.df['Subjective decisions for'].max()) +
-                0.3 * (net_goal_impact / abs(self.df['Net goal score']).max()) +
-                0.2 * (overturns_impact / self.df['Overturns'].max())
+        ngs_max, sdf_max, abs_ngs_max, ov_max = self._bias_normalizers()
+        
+        cols = np.array([
+            self._idx[name] for name in (
+                'Leading to goals for', 'Disallowed goals for', 
+                'Leading to goals against', 'Disallowed goals against', 
+                'Subjective decisions for', 'Subjective decisions against', 
+                'Net goal score', 'Overturns'
             )
+        ])
+        bias_score = _bias_kernel(self._num, cols, ngs_max, sdf_max, abs_ngs_max, ov_max)
+        
+        return pd.Series(bias_score, index=self.df.index)
+    
+    def calculate_comprehensive_bias_score_rowwise(self):
+        """
+        Row-by-row fallback for the bias score, kept for readability
+        """
+        # Normalizers are hoisted out of the per-row function
+        ngs_max, sdf_max, abs_ngs_max, ov_max = self._bias_normalizers()
+        
+        def bias_score(goals_for, disallowed_for, goals_against, disallowed_against,
+                       subjective_for, subjective_against, net_goal_impact, overturns_impact):
+            goals_bias = (goals_for - disallowed_for) - (goals_against - disallowed_against)
+            subjective_bias = subjective_for - subjective_against
             
-            return bias_score
+            return (
+                0.3 * (goals_bias / ngs_max) +
+                0.2 * (subjective_bias / sdf_max) +
+                0.3 * (net_goal_impact / abs_ngs_max) +
+                0.2 * (overturns_impact / ov_max)
+            )
         
-        return self.df.apply(bias_score, axis=1)
+        # Plain tuples avoid building a Series per row as apply(axis=1) does
+        cols = self.df[
+            ['Leading to goals for', 'Disallowed goals for', 
+             'Leading to goals against', 'Disallowed goals against', 
+             'Subjective decisions for', 'Subjective decisions against', 
+             'Net goal score', 'Overturns']
+        ]
+        scores = [bias_score(*row) for row in cols.itertuples(index=False, name=None)]
+        
+        return pd.Series(scores, index=self.df.index)
 
 
 
@@ -74,6 +169,121 @@ var_analyzer = VARBiasAnalyzer(FILE_PATH)
 
 # Calculate bias scores
 var_analyzer.df['Bias Score'] = var_analyzer.calculate_comprehensive_bias_score()
+var_analyzer.df_sorted = var_analyzer.df.sort_values('Bias Score', ascending=False)
+
+# Overall figures do not depend on the selected team, so build them once
+
+# Bias Score Ranking
+OVERALL_BIAS_FIG = px.bar(
+    var_analyzer.df_sorted, 
+    x='Team', 
+    y='Bias Score',
+    title='VAR Bias Scores Across Teams',
+    color='Bias Score',
+    color_continuous_scale='RdYlGn',
+    template='plotly_white+var_dash'
+)
+# Keep the ranking order rather than the alphabetical category order
+OVERALL_BIAS_FIG.update_xaxes(categoryorder='total descending')
+
+# Correlation Heatmap
+# NaNs are already filled during preprocessing, so plain np.corrcoef is safe
+corr_columns = ['Overturns', 'Leading to goals for', 'Disallowed goals for', 
+                'Net goal score', 'Subjective decisions for']
+corr_matrix = pd.DataFrame(
+    np.corrcoef(var_analyzer.df[corr_columns].to_numpy(), rowvar=False),
+    index=corr_columns,
+    columns=corr_columns
+)
+
+CORRELATION_FIG = px.imshow(
+    corr_matrix, 
+    title='Correlation of VAR Metrics',
+    color_continuous_scale='RdBu_r',
+    template='plotly_white+var_dash'
+)
+
+# Subjective Decisions Scatter, drawn with WebGL and downsampled on zoom
+SUBJECTIVE_SCATTER = FigureResampler(px.scatter(
+    var_analyzer.df, 
+    x='Subjective decisions for', 
+    y='Subjective decisions against',
+    color='Team',
+    title='Subjective Decisions Comparison',
+    hover_data=['Team', 'Subjective decisions for', 'Subjective decisions against'],
+    render_mode='webgl',
+    template='plotly_white+var_dash'
+))
+
+# Net Goal Score Box Plot
+NET_GOAL_BOXPLOT = px.box(
+    var_analyzer.df, 
+    x='Team', 
+    y='Net goal score',
+    title='Distribution of Net Goal Scores',
+    color='Team',
+    template='plotly_white+var_dash'
+)
+
+# Per-team values shown on the metric cards, keyed by team for direct lookup
+TEAM_METRICS = var_analyzer.team_view[
+    ['Overturns', 'Net goal score', 
+     'Subjective decisions for', 'Subjective decisions against']
+].to_dict('index')
+
+# Team figure skeletons; the team callback only patches their values and titles
+
+# Team VAR Metrics Breakdown; its category axis never changes
+_VAR_BREAKDOWN_X = ('Leading to goals for', 'Leading to goals against', 'Disallowed goals for', 'Disallowed goals against')
+
+TEAM_BREAKDOWN_FIG = go.Figure(
+    data=[
+        go.Bar(
+            x=list(_VAR_BREAKDOWN_X),
+            y=[0] * len(_VAR_BREAKDOWN_X),
+            marker_color=COLORS['secondary']
+        )
+    ],
+    layout=go.Layout(
+        title='VAR Metrics Breakdown',
+        xaxis={'title': 'Metrics'},
+        yaxis={'title': 'Count'},
+        template='var_dash'
+    )
+)
+
+# Team Subjective Decisions Pie Chart
+TEAM_SUBJECTIVE_PIE = go.Figure(
+    data=[
+        go.Pie(
+            labels=['For', 'Against'],
+            values=[0, 0],
+            hole=.3,
+            marker=dict(colors=[COLORS['primary'], COLORS['accent']])
+        )
+    ],
+    layout=go.Layout(
+        title='Subjective Decisions',
+        template='var_dash'
+    )
+)
+
+# Goals Impact Chart
+TEAM_GOALS_IMPACT_FIG = go.Figure(
+    data=[
+        go.Bar(
+            x=['Goals For', 'Goals Against'],
+            y=[0, 0],
+            marker_color=COLORS['secondary']
+        )
+    ],
+    layout=go.Layout(
+        title='Goals Impact',
+        xaxis={'title': 'Goals'},
+        yaxis={'title': 'Count'},
+        template='var_dash'
+    )
+)
 
 # Create Dash app with Bootstrap theme
 app = dash.Dash(__name__, external_stylesheets=[dbc.themes.BOOTSTRAP])
@@ -138,7 +348,7 @@ app.layout = dbc.Container([
             html.Label("Select Team:", style={'color': COLORS['text']}),
             dcc.Dropdown(
                 id='team-dropdown',
-                options=[{'label': team, 'value': team} for team in var_analyzer.df['Team']],
+                options=[{'label': team, 'value': team} for team in var_analyzer.df['Team'].cat.categories],
                 value='Arsenal',
                 placeholder="Select a team",
                 style={
@@ -149,6 +359,9 @@ app.layout = dbc.Container([
         ], width=6, className="mx-auto")
     ], className="mb-4"),
     
+    # Team metrics preloaded for the clientside metric cards callback
+    dcc.Store(id='team-data-store', data=TEAM_METRICS),
+    
     # Tabs with improved styling
     dbc.Tabs([
         # Overall Analysis Tab
@@ -158,7 +371,7 @@ app.layout = dbc.Container([
                 dbc.Col([
                     dbc.Card([
                         dbc.CardHeader("VAR Bias Scores"),
-                        dbc.CardBody(dcc.Graph(id='overall-bias-ranking'))
+                        dbc.CardBody(dcc.Graph(id='overall-bias-ranking', figure=OVERALL_BIAS_FIG))
                     ], className="card")
                 ], width=12),
                 
@@ -166,7 +379,7 @@ app.layout = dbc.Container([
                 dbc.Col([
                     dbc.Card([
                         dbc.CardHeader("Correlation of VAR Metrics"),
-                        dbc.CardBody(dcc.Graph(id='correlation-heatmap'))
+                        dbc.CardBody(dcc.Graph(id='correlation-heatmap', figure=CORRELATION_FIG))
                     ], className="card")
                 ], width=6),
                 
@@ -174,7 +387,7 @@ app.layout = dbc.Container([
                 dbc.Col([
                     dbc.Card([
                         dbc.CardHeader("Subjective Decisions Comparison"),
-                        dbc.CardBody(dcc.Graph(id='subjective-decisions-scatter'))
+                        dbc.CardBody(dcc.Graph(id='subjective-decisions-scatter', figure=SUBJECTIVE_SCATTER))
                     ], className="card")
                 ], width=6),
                 
@@ -182,7 +395,7 @@ app.layout = dbc.Container([
                 dbc.Col([
                     dbc.Card([
                         dbc.CardHeader("Net Goal Scores Distribution"),
-                        dbc.CardBody(dcc.Graph(id='net-goal-score-boxplot'))
+                        dbc.CardBody(dcc.Graph(id='net-goal-score-boxplot', figure=NET_GOAL_BOXPLOT))
                     ], className="card")
                 ], width=12)
             ])
@@ -193,7 +406,20 @@ app.layout = dbc.Container([
             dbc.Row([
                 # Team Metrics Cards
                 dbc.Col([
-                    html.Div(id='team-metrics-cards', style={
+                    html.Div(id='team-metrics-cards', children=[
+                        dbc.Card([
+                            dbc.CardHeader("Overturns"),
+                            dbc.CardBody(html.H4(id='metric-overturns', className="card-title", style={'color': COLORS['primary']}))
+                        ], className="card"),
+                        dbc.Card([
+                            dbc.CardHeader("Net Goal Score"),
+                            dbc.CardBody(html.H4(id='metric-netgoal', className="card-title", style={'color': COLORS['primary']}))
+                        ], className="card"),
+                        dbc.Card([
+                            dbc.CardHeader("Subjective Decisions"),
+                            dbc.CardBody(html.H4(id='metric-subj', className="card-title", style={'color': COLORS['primary']}))
+                        ], className="card")
+                    ], style={
                         'display': 'flex', 
                         'justifyContent': 'space-around',
                         'marginBottom': '20px'
@@ -204,21 +430,21 @@ app.layout = dbc.Container([
                 dbc.Col([
                     dbc.Card([
                         dbc.CardHeader("VAR Metrics Breakdown"),
-                        dbc.CardBody(dcc.Graph(id='team-var-metrics-breakdown'))
+                        dbc.CardBody(dcc.Graph(id='team-var-metrics-breakdown', figure=TEAM_BREAKDOWN_FIG))
                     ], className="card")
                 ], width=6),
                 
                 dbc.Col([
                     dbc.Card([
                         dbc.CardHeader("Subjective Decisions"),
-                        dbc.CardBody(dcc.Graph(id='team-subjective-decisions-pie'))
+                        dbc.CardBody(dcc.Graph(id='team-subjective-decisions-pie', figure=TEAM_SUBJECTIVE_PIE))
                     ], className="card")
                 ], width=6),
                 
                 dbc.Col([
                     dbc.Card([
                         dbc.CardHeader("Goals Impact"),
-                        dbc.CardBody(dcc.Graph(id='team-goals-impact-chart'))
+                        dbc.CardBody(dcc.Graph(id='team-goals-impact-chart', figure=TEAM_GOALS_IMPACT_FIG))
                     ], className="card")
                 ], width=12)
             ])
@@ -226,89 +452,25 @@ app.layout = dbc.Container([
     ])
 ], fluid=True)
 
+# Send only the visible, downsampled scatter points on zoom/pan
+SUBJECTIVE_SCATTER.register_update_graph_callback(app, 'subjective-decisions-scatter')
 
-# Callback for overall visualizations
-@app.callback(
+
+# Metric cards are filled in the browser from the preloaded team data
+app.clientside_callback(
+    ClientsideFunction(namespace='team', function_name='update_metrics'),
     [
-        Output('overall-bias-ranking', 'figure'),
-        Output('correlation-heatmap', 'figure'),
-        Output('subjective-decisions-scatter', 'figure'),
-        Output('net-goal-score-boxplot', 'figure')
+        Output('metric-overturns', 'children'),
+        Output('metric-netgoal', 'children'),
+        Output('metric-subj', 'children')
     ],
-    [Input('team-dropdown', 'value')]
+    [Input('team-dropdown', 'value')],
+    [State('team-data-store', 'data')]
 )
-def update_overall_visualizations(selected_team):
-    # Bias Score Ranking
-    overall_bias_fig = px.bar(
-        var_analyzer.df.sort_values('Bias Score', ascending=False), 
-        x='Team', 
-        y='Bias Score',
-        title='VAR Bias Scores Across Teams',
-        color='Bias Score',
-        color_continuous_scale='RdYlGn',
-        template='plotly_white'
-    )
-    overall_bias_fig.update_layout(
-        plot_bgcolor=COLORS['background'],
-        paper_bgcolor=COLORS['background'],
-        font_color=COLORS['text']
-    )
-    
-    # Correlation Heatmap
-    corr_matrix = var_analyzer.df[
-        ['Overturns', 'Leading to goals for', 'Disallowed goals for', 
-         'Net goal score', 'Subjective decisions for']
-    ].corr()
-    
-    correlation_fig = px.imshow(
-        corr_matrix, 
-        title='Correlation of VAR Metrics',
-        color_continuous_scale='RdBu_r',
-        template='plotly_white'
-    )
-    correlation_fig.update_layout(
-        plot_bgcolor=COLORS['background'],
-        paper_bgcolor=COLORS['background'],
-        font_color=COLORS['text']
-    )
-    
-    # Subjective Decisions Scatter
-    subjective_scatter = px.scatter(
-        var_analyzer.df, 
-        x='Subjective decisions for', 
-        y='Subjective decisions against',
-        color='Team',
-        title='Subjective Decisions Comparison',
-        hover_data=['Team', 'Subjective decisions for', 'Subjective decisions against'],
-        template='plotly_white'
-    )
-    subjective_scatter.update_layout(
-        plot_bgcolor=COLORS['background'],
-        paper_bgcolor=COLORS['background'],
-        font_color=COLORS['text']
-    )
-    
-    # Net Goal Score Box Plot
-    net_goal_boxplot = px.box(
-        var_analyzer.df, 
-        x='Team', 
-        y='Net goal score',
-        title='Distribution of Net Goal Scores',
-        color='Team',
-        template='plotly_white'
-    )
-    net_goal_boxplot.update_layout(
-        plot_bgcolor=COLORS['background'],
-        paper_bgcolor=COLORS['background'],
-        font_color=COLORS['text']
-    )
-    
-    return overall_bias_fig, correlation_fig, subjective_scatter, net_goal_boxplot
 
 # Callback for team-specific updates
 @app.callback(
     [
-        Output('team-metrics-cards', 'children'),
         Output('team-var-metrics-breakdown', 'figure'),
         Output('team-subjective-decisions-pie', 'figure'),
         Output('team-goals-impact-chart', 'figure')
@@ -317,99 +479,31 @@ def update_overall_visualizations(selected_team):
 )
 def update_team_section(selected_team):
     if not selected_team:
-        return (
-            [],
-            {},
-            {},
-            {}
-        )
+        return TEAM_BREAKDOWN_FIG, TEAM_SUBJECTIVE_PIE, TEAM_GOALS_IMPACT_FIG
     
     # Get team-specific data
-    team_data = var_analyzer.df[var_analyzer.df['Team'] == selected_team].iloc[0]
+    team_data = var_analyzer.team_view.loc[selected_team]
     
-    # Metrics Cards
-    metrics_cards = [
-        dbc.Card([
-            dbc.CardHeader("Overturns"),
-            dbc.CardBody(html.H4(f"{team_data['Overturns']}", className="card-title", style={'color': COLORS['primary']}))
-        ], className="card"),
-        dbc.Card([
-            dbc.CardHeader("Net Goal Score"),
-            dbc.CardBody(html.H4(f"{team_data['Net goal score']}", className="card-title", style={'color': COLORS['primary']}))
-        ], className="card"),
-        dbc.Card([
-            dbc.CardHeader("Subjective Decisions"),
-            dbc.CardBody(html.H4(f"{team_data['Subjective decisions for']} - {team_data['Subjective decisions against']}", 
-                                  className="card-title", style={'color': COLORS['primary']}))
-        ], className="card")
-    ]
-    
-    # Team VAR Metrics Breakdown
-    var_metrics_breakdown = {
-        'data':
-            [
-                go.Bar(
-                    x=['Leading to goals for', 'Leading to goals against', 'Disallowed goals for', 'Disallowed goals against'],
-                    y=[
-                        team_data['Leading to goals for'],
-                        team_data['Leading to goals against'],
-                        team_data['Disallowed goals for'],
-                        team_data['Disallowed goals against']
-                    ],
-                    marker_color=COLORS['secondary']
-                )
-            ],
-            'layout': go.Layout(
-                title=f'VAR Metrics Breakdown for {selected_team}',
-                xaxis={'title': 'Metrics'},
-                yaxis={'title': 'Count'},
-                plot_bgcolor=COLORS['background'],
-                paper_bgcolor=COLORS['background'],
-                font_color=COLORS['text']
-            )
-        }
+    # Only the changed values and titles are sent to the browser
+    var_metrics_breakdown = Patch()
+    var_metrics_breakdown['data'][0]['y'] = [team_data[metric] for metric in _VAR_BREAKDOWN_X]
+    var_metrics_breakdown['layout']['title']['text'] = f'VAR Metrics Breakdown for {selected_team}'
     
-    # Team Subjective Decisions Pie Chart
-    subjective_decisions_pie = {
-        'data': [
-            go.Pie(
-                labels=['For', 'Against'],
-                values=[team_data['Subjective decisions for'], team_data['Subjective decisions against']],
-                hole=.3,
-                marker=dict(colors=[COLORS['primary'], COLORS['accent']])
-            )
-        ],
-        'layout': go.Layout(
-            title=f'Subjective Decisions for {selected_team}',
-            plot_bgcolor=COLORS['background'],
-            paper_bgcolor=COLORS['background'],
-            font_color=COLORS['text']
-        )
-    }
+    subjective_decisions_pie = Patch()
+    subjective_decisions_pie['data'][0]['values'] = [
+        team_data['Subjective decisions for'],
+        team_data['Subjective decisions against']
+    ]
+    subjective_decisions_pie['layout']['title']['text'] = f'Subjective Decisions for {selected_team}'
     
-    # Goals Impact Chart
-    goals_impact_chart = {
-        'data': [
-            go.Bar(
-                x=['Goals For', 'Goals Against'],
-                y=[
-                    team_data['Leading to goals for'],
-                    team_data['Leading to goals against']
-                ],
-                marker_color=COLORS['secondary']
-            )
-        ],
-        'layout': go.Layout(
-            title=f'Goals Impact for {selected_team}',
-            xaxis={'title': 'Goals'},
-            yaxis={'title': 'Count'},
-            plot_bgcolor=COLORS['background'],
-            paper_bgcolor=COLORS['background'],
-            font_color=COLORS['text']
-        )
-    }
+    goals_impact_chart = Patch()
+    goals_impact_chart['data'][0]['y'] = [
+        team_data['Leading to goals for'],
+        team_data['Leading to goals against']
+    ]
+    goals_impact_chart['layout']['title']['text'] = f'Goals Impact for {selected_team}'
     
-    return metrics_cards, var_metrics_breakdown, subjective_decisions_pie, goals_impact_chart
+    return var_metrics_breakdown, subjective_decisions_pie, goals_impact_chart
 
 
 # Run the app
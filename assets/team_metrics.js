@@ -0,0 +1,15 @@
+window.dash_clientside = Object.assign({}, window.dash_clientside, {
+    team: {
+        update_metrics: function(selectedTeam, teamData) {
+            const team = teamData && teamData[selectedTeam];
+            if (!team) {
+                return ['', '', ''];
+            }
+            return [
+                String(team['Overturns']),
+                String(team['Net goal score']),
+                team['Subjective decisions for'] + ' - ' + team['Subjective decisions against']
+            ];
+        }
+    }
+});
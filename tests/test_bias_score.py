@@ -0,0 +1,58 @@
+import ast
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+SCRIPT = Path(__file__).resolve().parent.parent / 'VAR bias in the PL - EDA.py'
+DATA = SCRIPT.parent / 'VAR_Team_Stats.csv'
+
+
+def load_analyzer():
+    """
+    Load VARBiasAnalyzer without running the dashboard's module-level code
+    """
+    tree = ast.parse(SCRIPT.read_text(encoding='utf-8'))
+    keep = []
+    for node in tree.body:
+        if isinstance(node, ast.Import) and node.names[0].name in ('pandas', 'numpy'):
+            keep.append(node)
+        elif isinstance(node, ast.ImportFrom) and node.module == 'numba':
+            keep.append(node)
+        elif isinstance(node, (ast.FunctionDef, ast.ClassDef)) and \
+                node.name in ('_bias_kernel', 'VARBiasAnalyzer'):
+            keep.append(node)
+    # numba's cache=True needs a module name to locate its cache entries
+    namespace = {'__name__': 'var_bias_eda'}
+    exec(compile(ast.Module(body=keep, type_ignores=[]), str(SCRIPT), 'exec'), namespace)
+    return namespace['VARBiasAnalyzer']
+
+
+VARBiasAnalyzer = load_analyzer()
+
+
+def test_vectorized_matches_rowwise():
+    analyzer = VARBiasAnalyzer(DATA)
+
+    vectorized = analyzer.calculate_comprehensive_bias_score()
+    rowwise = analyzer.calculate_comprehensive_bias_score_rowwise()
+
+    assert vectorized.dtype == np.float64
+    assert rowwise.dtype == np.float64
+    np.testing.assert_allclose(vectorized, rowwise)
+
+
+@pytest.mark.parametrize('column', ['Overturns', 'Net goal score', 'Subjective decisions for'])
+def test_zero_normalizer_gives_nan_on_both_paths(tmp_path, column):
+    df = pd.read_csv(DATA)
+    df[column] = 0
+    path = tmp_path / 'stats.csv'
+    df.to_csv(path, index=False)
+    analyzer = VARBiasAnalyzer(path)
+
+    vectorized = analyzer.calculate_comprehensive_bias_score()
+    rowwise = analyzer.calculate_comprehensive_bias_score_rowwise()
+
+    assert not np.isfinite(vectorized).all()
+    np.testing.assert_allclose(vectorized, rowwise)